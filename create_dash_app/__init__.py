@@ -0,0 +1,17 @@
+"""
+`create-dash-app`: Create a new Plotly Dash application with opinionated boilerplate code.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_version() -> str:
+    """Get the package version from installed package metadata."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("create-dash-app")
+    except PackageNotFoundError:
+        # Fallback for development/editable installs
+        return "dev"
@@ -1,9 +1,43 @@
 """
 Entry point if user decides to run `python -m create_dash_app` instead of the
 CLI command `create-dash-app`.
+
+This is also the entry point of the `create-dash-app` CLI command itself so that
+`--help` and `--version` can be answered without importing `click` or anything
+else the actual command needs.
 """
 
-from .cli import create_dash_app
+import sys
+
+from . import get_version
+
+# NOTE: Keep in sync with the `create_dash_app` click command in `cli.py`.
+HELP_MESSAGE = """\
+Usage: create-dash-app [OPTIONS]
+
+  Create a new Plotly Dash application with opinionated boilerplate code.
+
+Options:
+  -V, --version  Show the version and exit.
+  -v, --verbose  Print the collected project configuration.
+  -h, --help     Show this message and exit."""
+
+
+def main() -> None:
+    """Run the `create-dash-app` CLI, answering `--help`/`--version` directly."""
+    args = sys.argv[1:]
+    if len(args) == 1:
+        if args[0] in ("-V", "--version"):
+            print(f"create-dash-app version {get_version()}")
+            sys.exit(0)
+        if args[0] in ("-h", "--help"):
+            print(HELP_MESSAGE)
+            sys.exit(0)
+
+    from .cli import create_dash_app
 
-if __name__ == "__main__":
     create_dash_app()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,30 @@
 """
-Actual entry point for the CLI command `create-dash-app`.
+The `create-dash-app` CLI command, run via the entry point in `__main__.py`.
 """
 
-from importlib.metadata import PackageNotFoundError, version
-from pathlib import Path
+import os
 
 import click
 
-from .generator import ProjectGenerator
-from .prompts import collect_project_config
+from . import get_version
 
+# Entries whose presence suggests the current directory is already a project directory
+PROJECT_INDICATORS = frozenset((
+    "pyproject.toml",
+    "src",
+    ".venv",
+    "venv",
+    "requirements.txt",
+    "setup.py",
+))
 
-def get_version() -> str:
-    """Get the package version from installed package metadata."""
-    try:
-        return version("create-dash-app")
-    except PackageNotFoundError:
-        # Fallback for development/editable installs
-        return "dev"
+
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Print the version and exit. Metadata is only resolved when `--version` is requested."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"create-dash-app version {get_version()}", color=ctx.color)
+    ctx.exit()
 
 
 def _warn_if_inside_project_directory() -> None:
@@ -27,20 +34,14 @@ def _warn_if_inside_project_directory() -> None:
     This helps prevent creating nested project structures like:
     business-dashboard/business-dashboard/
     """
-    cwd = Path.cwd()
-
-    # Check for common project indicators
-    project_indicators = [
-        "pyproject.toml",
-        "src",
-        ".venv",
-        "venv",
-        "requirements.txt",
-        "setup.py",
-    ]
-
-    # Check if current directory looks like a project directory
-    has_indicators = any((cwd / indicator).exists() for indicator in project_indicators)
+    # Check if current directory looks like a project directory. A single directory listing
+    # is used rather than one `stat()` per indicator. A directory that can't be listed is
+    # treated as having no indicators since this is only a warning.
+    try:
+        with os.scandir(".") as entries:
+            has_indicators = any(entry.name in PROJECT_INDICATORS for entry in entries)
+    except OSError:
+        has_indicators = False
 
     if has_indicators:
         warning_msg = (
@@ -67,13 +68,23 @@ def _warn_if_inside_project_directory() -> None:
     context_settings={"help_option_names": ["-h", "--help"]},
     help="Create a new Plotly Dash application with opinionated boilerplate code.",
 )
-@click.version_option(
-    version=get_version(),
-    prog_name="create-dash-app",
-    message="%(prog)s version %(version)s",
+@click.option(
+    "-V",
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
     help="Show the version and exit.",
 )
-def create_dash_app():
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    default=False,
+    help="Print the collected project configuration.",
+)
+def create_dash_app(verbose: bool):
     """
     Create a new Plotly Dash application with opinionated boilerplate code.
 
@@ -95,14 +106,22 @@ def create_dash_app():
         $ create-dash-app --help
         $ create-dash-app --version
         $ create-dash-app -V
+        $ create-dash-app --verbose
     """
 
     # Warn if running from inside a project directory
     _warn_if_inside_project_directory()
 
+    # Deferred so `--help`/`--version` don't pay for Jinja2, Pydantic and questionary
+    from .generator import ProjectGenerator
+    from .prompts import collect_project_config
+
     try:
         project_config = collect_project_config()
-        click.echo(f"Your Project Configuration:\n\n{project_config.model_dump_json(indent=2)}\n\n")
+        if verbose:
+            click.echo(
+                f"Your Project Configuration:\n\n{project_config.model_dump_json(indent=2)}\n\n"
+            )
     except FileExistsError as e:
         click.echo(click.style(f"\n\n‼️ ERROR! {e}\n\n", fg="bright_red", bold=True))
         return
@@ -1,14 +1,19 @@
-import json
 import os
-import shutil
-import subprocess
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-from jinja2 import Environment, FileSystemLoader
 
 from .models.project_config import ProjectConfig
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+# Buffer size used when writing rendered templates so each file is flushed in as few
+# `write()` syscalls as possible.
+WRITE_BUFFER_SIZE = 64 * 1024
+
 
 # TODO: Add support for `create-dash-app build-tailwind-css` script to build `tailwind-output` file.
 class ProjectGenerator:
@@ -51,13 +56,45 @@ class ProjectGenerator:
         # Contains the template files for the specific template type
         self.template_path = self.templates_base_path / template_type
 
-        # Create Jinja2 environment that can load from both templates/ and templates/<type>/
-        self.jinja_env = Environment(
+        # String forms of the above used when walking/slicing template paths
+        self._templates_base_path_str = str(self.templates_base_path)
+        self._template_path_str = str(self.template_path)
+
+    @cached_property
+    def jinja_env(self) -> "Environment":
+        """
+        Jinja2 environment that can load from both templates/ and templates/<type>/.
+
+        Created on first use so that Jinja2 is only imported once files are generated.
+        """
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        # Compiled templates are cached on disk across runs since the templates only change
+        # between releases of this package. Jinja2's default cache directory is used as it is
+        # per-user, private (0700) and refused if owned by someone else. The cache is only a
+        # speed-up, so generation goes on without it if no safe directory is available.
+        try:
+            bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError):
+            bytecode_cache = None
+
+        return Environment(
             loader=FileSystemLoader(searchpath=[self.templates_base_path, self.template_path]),
             autoescape=True,
             trim_blocks=True,
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            cache_size=-1,
         )
 
+    @cached_property
+    def _template_cache(self) -> dict[str, tuple["Template", str, str]]:
+        """
+        Every template loaded once, keyed by its path, along with where its rendered output
+        goes (relative to the project root) so generation is a plain dict lookup.
+        """
+        return self._load_templates()
+
     def generate_project(self, config: ProjectConfig) -> None:
         """Generate the complete project structure."""
         try:
@@ -66,18 +103,18 @@ class ProjectGenerator:
             # (config might have "." but we need the actual directory name for templates)
             if config.project_name == ".":
                 config = config.model_copy(update={"project_name": self.project_name})
+            has_tailwind = "tailwind" in config.styling
             self._generate_files(config)
             self._create_env_file(config)
-            self._setup_tailwind_css(config)
-            self._initialize_uv_dependencies()
+            self._install_dependencies(has_tailwind)
             self._make_executable_files()
             click.echo(
                 click.style(f"✅ Successfully created {self.project_name}", fg="green", bold=True)
             )
-            self._display_next_steps(config)
+            self._display_next_steps(config, has_tailwind)
         except Exception as e:
-            self._cleanup_on_error()
             click.echo(click.style(f"❌ Error creating project: {e}", fg="red"), err=True)
+            self._cleanup_on_error()
 
     def _create_project_dirs(self, config: ProjectConfig) -> None:
         """
@@ -94,7 +131,7 @@ class ProjectGenerator:
             )
         else:
             # Create the project's ROOT directory
-            if os.path.exists(self.project_name):
+            if os.path.lexists(self.project_name):
                 raise FileExistsError(
                     f"Directory {self.project_name} already exists! "
                     "Please choose a different project name."
@@ -109,34 +146,112 @@ class ProjectGenerator:
 
     def _generate_files(self, config: ProjectConfig) -> None:
         """Generate all project files from templates."""
-        # Process shared root-level templates (files directly in templates/)
-        for template in self.templates_base_path.iterdir():
-            if template.is_file():
-                # Allow hidden files if they have .jinja extension
-                # (e.g., .env.development.jinja)
-                if not template.name.startswith(".") or template.suffix == ".jinja":
-                    self._process_template_file(template, config, is_root_template=True)
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Serialize the config once and share it across every template render
+        context = config.model_dump()
+
+        # Create each target directory once up front (parents first) rather than once per
+        # template file, which also keeps the worker threads below from racing on `mkdir`
+        for target_dir in sorted({
+            target_dir for _, target_dir, _ in self._template_cache.values()
+        }):
+            (self.project_path / target_dir).mkdir(parents=True, exist_ok=True)
+
+        # Rendering is cheap but writing is I/O-bound, so overlap the two across threads.
+        # Jinja2 templates are safe to render concurrently once loaded.
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+            futures = [
+                executor.submit(self._process_template_file, template, context)
+                for template in self._template_cache
+            ]
+            # Surface the first failure (if any) to `generate_project`
+            for future in futures:
+                future.result()
+
+        click.echo(click.style("✅ Successfully generated template files!", fg="green", bold=True))
+
+    def _collect_templates(self) -> list[tuple[str, bool]]:
+        """
+        Collect every template file to render in a single pass over the templates tree.
 
-        # Process template-specific files (files in templates/<type>/)
-        for template in self.template_path.rglob("*"):
-            if template.is_file():
+        Returns:
+            `(template, is_root_template)` tuples where `template` is the template's path as
+            a plain string (no `Path` objects are built per entry). Root templates are the
+            files directly in `templates/`; the rest are every file (recursively) in
+            `templates/<type>/`.
+
+        NOTE: `os.scandir` is used instead of `Path.iterdir`/`Path.rglob` since its `DirEntry`
+        objects carry the file type reported by the directory listing itself, so filtering
+        files from directories needs no extra `stat()` call per entry.
+        """
+        templates: list[tuple[str, bool]] = []
+
+        # Shared root-level templates (files directly in templates/)
+        with os.scandir(self._templates_base_path_str) as entries:
+            for entry in entries:
                 # Allow hidden files if they have .jinja extension
                 # (e.g., .env.development.jinja)
-                if not template.name.startswith(".") or template.suffix == ".jinja":
-                    self._process_template_file(template, config, is_root_template=False)
+                if entry.is_file(follow_symlinks=False) and (
+                    not entry.name.startswith(".") or entry.name.endswith(".jinja")
+                ):
+                    templates.append((entry.path, True))
+
+        # Template-specific files (files in templates/<type>/, recursively)
+        stack = [self._template_path_str]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and (
+                        not entry.name.startswith(".") or entry.name.endswith(".jinja")
+                    ):
+                        templates.append((entry.path, False))
+
+        return templates
+
+    def _load_templates(self) -> dict[str, tuple["Template", str, str]]:
+        """
+        Load all templates from `_collect_templates` through the Jinja2 environment.
 
-        click.echo(click.style("✅ Successfully generated template files!", fg="green", bold=True))
+        Returns:
+            A mapping of template path to a `(template, target_dir, output_filename)` tuple,
+            where `target_dir` is relative to the project root:
+            - files directly in `templates/` go to the project root (shared across types)
+            - files in `templates/<type>/` go to `src/` (template-specific)
+        """
+        template_cache: dict[str, tuple["Template", str, str]] = {}
+        for template, is_root_template in self._collect_templates():
+            # Paths from `os.scandir` are always `<base_path><sep><relative path>`, so
+            # slicing is enough to get the template name relative to its search path.
+            base_path = (
+                self._templates_base_path_str if is_root_template else self._template_path_str
+            )
+            template_rel_path = template[len(base_path) + 1 :]
+            rel_dir, template_name = os.path.split(template_rel_path)
+
+            # Jinja2 template names always use forward slashes
+            template_obj = self.jinja_env.get_template(template_rel_path.replace(os.sep, "/"))
+
+            target_dir = rel_dir if is_root_template else os.path.join("src", rel_dir)
+            # Remove the .jinja extension from the output file
+            output_filename = (
+                template_name[: -len(".jinja")]
+                if template_name.endswith(".jinja")
+                else template_name
+            )
+            template_cache[template] = (template_obj, target_dir, output_filename)
 
-    def _process_template_file(
-        self, template: Path, config: ProjectConfig, is_root_template: bool
-    ) -> None:
+        return template_cache
+
+    def _process_template_file(self, template: str, context: dict[str, Any]) -> None:
         """
         Generate a single template file.
 
         Args:
-            template: Path to the template file
-            config: Project configuration
-            is_root_template: If True, file goes to project root; if False, goes to src/
+            template: Path to the template file (a key of `_template_cache`)
+            context: Project configuration as a dictionary (i.e. `ProjectConfig.model_dump()`)
 
         NOTE: With template generation, the `create_dash_app` CLI has a `templates/` directory which
         also is structured to mimic the actual project structure. Thus, for each detected `.jinja`
@@ -145,43 +260,38 @@ class ProjectGenerator:
         Files directly in `templates/` go to project root (shared across template types).
         Files in `templates/<type>/` go to `src/` directory (template-specific).
         """
-        # Determine the base path for relative path calculation
-        base_path = self.templates_base_path if is_root_template else self.template_path
-        template_rel_path = template.relative_to(base_path)
-
-        # Load template - try with relative path first
-        try:
-            template_file = self.jinja_env.get_template(str(template_rel_path))
-        except Exception:
-            # Fallback: try with just the filename if relative path fails
-            template_file = self.jinja_env.get_template(template.name)
+        template_file, rel_target_dir, output_filename = self._template_cache[template]
 
         # Prevent rendering of baseline pre-commit hook configurations if not chosen
-        if not config.configure_pre_commit and "pre-commit" in template.name.lower():
+        if not context["configure_pre_commit"] and "pre-commit" in output_filename.lower():
             click.echo(
                 click.style(f"Skipping {template_file.name} configurations ...", fg="yellow")
             )
             return
 
-        # Render the template file by unpacking the provided config as a dictionary
-        rendered_template = template_file.render(**config.model_dump())
+        # Stream the rendered template straight into the target file rather than rendering
+        # the whole file into a string first
+        target_file = self.project_path / rel_target_dir / output_filename
+        with open(target_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            template_file.stream(**context).dump(f)
 
-        # Determine target directory based on whether it's a root template
-        if is_root_template:
-            # Root templates go directly to project root
-            target_dir = self.project_path
-        else:
-            # Template-specific files go to src/
-            file_directory = template.parent.relative_to(self.template_path)
-            target_dir = self.project_path / "src" / file_directory
+    def _install_dependencies(self, has_tailwind: bool) -> None:
+        """
+        Run the Tailwind CSS (npm) and `uv` setups concurrently.
 
-        target_dir.mkdir(parents=True, exist_ok=True)
+        Both are dominated by network-bound package resolution and are independent of each
+        other once `package.json`/`pyproject.toml` exist, so there is no need to wait for
+        one before starting the other. Steps *within* each setup still run in order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Write the rendered template to the target file (remove .jinja extension)
-        output_filename = template.stem if template.suffix == ".jinja" else template.name
-        target_file = target_dir / output_filename
-        with open(target_file, "w", encoding="utf-8") as f:
-            f.write(rendered_template)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._setup_tailwind_css, has_tailwind),
+                executor.submit(self._initialize_uv_dependencies),
+            ]
+            for future in futures:
+                future.result()
 
     def _initialize_uv_dependencies(self) -> None:
         """
@@ -189,8 +299,12 @@ class ProjectGenerator:
         install dependencies. This should be run after pyproject.toml is generated.
 
         The templated pyproject.toml is used, and uv sync will generate the lock file
-        and install all dependencies defined in pyproject.toml.
+        and install all dependencies defined in pyproject.toml. Since the templated
+        pyproject.toml declares a `[build-system]` (and `[tool.uv] package = true`), uv sync
+        also installs the project itself in editable mode so its console scripts work.
         """
+        import subprocess
+
         pyproject_path = self.project_path / "pyproject.toml"
         if not pyproject_path.exists():
             click.echo(click.style("⚠️  pyproject.toml not found, skipping uv sync", fg="yellow"))
@@ -204,8 +318,8 @@ class ProjectGenerator:
                 subprocess.run(
                     ["uv", "venv"],
                     cwd=str(self.project_path),
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     check=True,
                 )
 
@@ -215,23 +329,10 @@ class ProjectGenerator:
                 )
             )
             subprocess.run(
-                ["uv", "sync"],
+                ["uv", "sync", "--no-progress"],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            # Install the package in editable mode so console scripts work
-            click.echo(
-                click.style(
-                    "Installing package in editable mode for console scripts ...", fg="blue"
-                )
-            )
-            subprocess.run(
-                ["uv", "pip", "install", "-e", "."],
-                cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
             )
             click.echo(
@@ -243,7 +344,10 @@ class ProjectGenerator:
             )
         except subprocess.CalledProcessError as e:
             click.echo(
-                click.style(f"⚠️  Warning: uv sync failed: {e.stderr}", fg="yellow"),
+                click.style(
+                    f"⚠️  Warning: uv sync failed: {e.stderr.decode('utf-8', errors='replace')}",
+                    fg="yellow",
+                ),
                 err=True,
             )
         except FileNotFoundError:
@@ -271,39 +375,62 @@ HOST=127.0.0.1
 # Environment mode (development or production)
 ENVIRONMENT=development
 """
-        with open(env_file, "w", encoding="utf-8") as f:
-            f.write(env_content)
+        env_file.write_text(env_content, encoding="utf-8")
         click.echo(click.style("Created .env file with configured PORT", fg="blue"))
 
-    def _setup_tailwind_css(self, config: ProjectConfig) -> None:
+    def _setup_tailwind_css(self, has_tailwind: bool) -> None:
         """
         Set up Tailwind CSS if it's selected in the styling configuration.
 
         This method:
-        - Initializes npm in the project
+        - Writes package.json with the CSS build scripts (or adds them to an existing one)
         - Installs tailwindcss and @tailwindcss/cli as dev dependencies
         - Creates tailwind.css entry file
         - Creates tailwind.config.js
-        - Updates package.json with build scripts
         - Runs the production build to generate the compiled CSS
+
+        NOTE: package.json is written directly rather than through `npm init -y`, and the
+        build runs the Tailwind CLI via `npx` rather than `npm run`, since every `npm`
+        invocation pays for a cold Node.js start.
+
+        Args:
+            has_tailwind: Whether `tailwind` is in the styling configuration
         """
-        if "tailwind" not in config.styling:
+        if not has_tailwind:
             return
 
+        import json
+        import subprocess
+
         package_json_path = self.project_path / "package.json"
+        build_css_args = [
+            "tailwindcss",
+            "-i",
+            "./src/assets/tailwind.css",
+            "-o",
+            "./src/assets/tailwind-output.css",
+        ]
 
         try:
-            # Initialize npm if package.json doesn't exist
-            if not package_json_path.exists():
-                click.echo(click.style("Initializing npm for Tailwind CSS setup ...", fg="blue"))
-                subprocess.run(
-                    ["npm", "init", "-y"],
-                    cwd=str(self.project_path),
-                    capture_output=True,
-                    text=True,
-                    check=True,
+            # Create package.json (or reuse an existing one) along with the build scripts
+            if package_json_path.exists():
+                package_json = json.loads(package_json_path.read_text(encoding="utf-8"))
+            else:
+                click.echo(
+                    click.style("Creating package.json for Tailwind CSS setup ...", fg="blue")
                 )
-                click.echo(click.style("✅ Initialized npm", fg="green"))
+                package_json = {
+                    "name": self.project_name.lower().replace(" ", "-").replace("_", "-"),
+                    "version": "0.1.0",
+                    "private": True,
+                }
+
+            package_json.setdefault("scripts", {})
+            package_json["scripts"]["build:css"] = " ".join([*build_css_args, "--watch"])
+            package_json["scripts"]["build:css:prod"] = " ".join([*build_css_args, "--minify"])
+
+            package_json_path.write_text(json.dumps(package_json, indent=2), encoding="utf-8")
+            click.echo(click.style("✅ Created package.json with build scripts", fg="green"))
 
             # Install Tailwind CSS and CLI
             click.echo(
@@ -312,8 +439,8 @@ ENVIRONMENT=development
             subprocess.run(
                 ["npm", "install", "-D", "tailwindcss", "@tailwindcss/cli"],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
             )
             click.echo(click.style("✅ Installed Tailwind CSS dependencies", fg="green"))
@@ -321,8 +448,7 @@ ENVIRONMENT=development
             # Create tailwind.css entry file
             tailwind_css_path = self.project_path / "src" / "assets" / "tailwind.css"
             tailwind_css_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(tailwind_css_path, "w", encoding="utf-8") as f:
-                f.write('@import "tailwindcss";\n')
+            tailwind_css_path.write_text('@import "tailwindcss";\n', encoding="utf-8")
             click.echo(click.style("✅ Created tailwind.css entry file", fg="green"))
 
             # Create tailwind.config.js
@@ -339,35 +465,16 @@ module.exports = {
   plugins: [],
 }
 """
-            with open(tailwind_config_path, "w", encoding="utf-8") as f:
-                f.write(tailwind_config_content)
+            tailwind_config_path.write_text(tailwind_config_content, encoding="utf-8")
             click.echo(click.style("✅ Created tailwind.config.js", fg="green"))
 
-            # Update package.json with build scripts
-            with open(package_json_path, "r", encoding="utf-8") as f:
-                package_json = json.load(f)
-
-            package_json.setdefault("scripts", {})
-            package_json["scripts"]["build:css"] = (
-                "tailwindcss -i ./src/assets/tailwind.css "
-                "-o ./src/assets/tailwind-output.css --watch"
-            )
-            package_json["scripts"]["build:css:prod"] = (
-                "tailwindcss -i ./src/assets/tailwind.css "
-                "-o ./src/assets/tailwind-output.css --minify"
-            )
-
-            with open(package_json_path, "w", encoding="utf-8") as f:
-                json.dump(package_json, f, indent=2)
-            click.echo(click.style("✅ Updated package.json with build scripts", fg="green"))
-
-            # Run the production build
+            # Run the production build (same as `npm run build:css:prod`)
             click.echo(click.style("Building Tailwind CSS (production build) ...", fg="blue"))
             subprocess.run(
-                ["npm", "run", "build:css:prod"],
+                ["npx", *build_css_args, "--minify"],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
             )
             click.echo(
@@ -377,7 +484,8 @@ module.exports = {
         except subprocess.CalledProcessError as e:
             click.echo(
                 click.style(
-                    f"⚠️  Warning: Tailwind CSS setup failed: {e.stderr}",
+                    f"⚠️  Warning: Tailwind CSS setup failed: "
+                    f"{e.stderr.decode('utf-8', errors='replace')}",
                     fg="yellow",
                 ),
                 err=True,
@@ -409,98 +517,105 @@ module.exports = {
             )
         )
 
-    def _display_next_steps(self, config: ProjectConfig) -> None:
-        """Display helpful next steps after project creation."""
+    def _display_next_steps(self, config: ProjectConfig, has_tailwind: bool) -> None:
+        """
+        Display helpful next steps after project creation.
+
+        NOTE: Lines are collected and echoed all at once instead of one `click.echo` per line.
+        """
+        lines: list[str] = []
         project_slug = config.project_name.lower().replace(" ", "-").replace("_", "-")
 
-        click.echo("")
-        click.echo(click.style("📋 Next Steps:", fg="cyan", bold=True))
-        click.echo("")
+        lines.append("")
+        lines.append(click.style("📋 Next Steps:", fg="cyan", bold=True))
+        lines.append("")
 
         step_num = 1
 
         # Step 1: Navigate to project directory (skip if initializing current dir)
         if self.project_path != Path("."):
-            click.echo(click.style(f"{step_num}. Navigate to your project:", fg="yellow"))
-            click.echo(f"   cd {self.project_name}")
-            click.echo("")
+            lines.append(click.style(f"{step_num}. Navigate to your project:", fg="yellow"))
+            lines.append(f"   cd {self.project_name}")
+            lines.append("")
             step_num += 1
 
         # Step 2: Activate virtual environment (required for console script)
-        click.echo(
+        lines.append(
             click.style(
                 f"{step_num}. Activate the virtual environment (required for console script):",
                 fg="yellow",
             )
         )
-        click.echo("   # The virtual environment (.venv) has already been created")
-        click.echo("   # On macOS/Linux:")
-        click.echo("   source .venv/bin/activate")
-        click.echo("")
-        click.echo("   # On Windows:")
-        click.echo("   .venv\\Scripts\\activate")
-        click.echo("")
+        lines.append("   # The virtual environment (.venv) has already been created")
+        lines.append("   # On macOS/Linux:")
+        lines.append("   source .venv/bin/activate")
+        lines.append("")
+        lines.append("   # On Windows:")
+        lines.append("   .venv\\Scripts\\activate")
+        lines.append("")
         step_num += 1
 
         # Step 3: Run the application using console script (recommended)
-        click.echo(
+        lines.append(
             click.style(
                 f"{step_num}. Run your Dash application using the console script:",
                 fg="yellow",
             )
         )
-        click.echo(f"   {project_slug}")
-        click.echo("")
-        click.echo(f"   # The app will start and be available at http://127.0.0.1:{config.port}")
-        click.echo("")
+        lines.append(f"   {project_slug}")
+        lines.append("")
+        lines.append(f"   # The app will start and be available at http://127.0.0.1:{config.port}")
+        lines.append("")
         step_num += 1
 
         # Step 4: Alternative methods
-        click.echo(
+        lines.append(
             click.style(f"{step_num}. Alternative: Run without activating venv:", fg="yellow")
         )
-        click.echo("   # Using uv run (no activation needed):")
-        click.echo(f"   uv run {project_slug}")
-        click.echo("   # Or")
-        click.echo("   uv run python -m src.app")
-        click.echo("")
+        lines.append("   # Using uv run (no activation needed):")
+        lines.append(f"   uv run {project_slug}")
+        lines.append("   # Or")
+        lines.append("   uv run python -m src.app")
+        lines.append("")
         step_num += 1
 
         # Step 5: Build Tailwind CSS (if configured)
-        if "tailwind" in config.styling:
-            click.echo(click.style(f"{step_num}. Build Tailwind CSS (if needed):", fg="yellow"))
-            click.echo("   # For production build:")
-            click.echo("   npm run build:css:prod")
-            click.echo("")
-            click.echo("   # For watch mode during development:")
-            click.echo("   npm run build:css")
-            click.echo("")
+        if has_tailwind:
+            lines.append(click.style(f"{step_num}. Build Tailwind CSS (if needed):", fg="yellow"))
+            lines.append("   # For production build:")
+            lines.append("   npm run build:css:prod")
+            lines.append("")
+            lines.append("   # For watch mode during development:")
+            lines.append("   npm run build:css")
+            lines.append("")
             step_num += 1
 
         # Step 6: Development tips
-        click.echo(click.style(f"{step_num}. Development tips:", fg="yellow"))
-        click.echo("   • The app will automatically open in your browser")
-        click.echo(f"   • Default URL: http://127.0.0.1:{config.port}")
-        click.echo("   • Edit files in src/ to customize your app")
+        lines.append(click.style(f"{step_num}. Development tips:", fg="yellow"))
+        lines.append("   • The app will automatically open in your browser")
+        lines.append(f"   • Default URL: http://127.0.0.1:{config.port}")
+        lines.append("   • Edit files in src/ to customize your app")
         if config.include_pages:
-            click.echo("   • Add new pages in src/pages/")
-        click.echo("   • Add callbacks in src/callbacks/")
-        click.echo("   • Add components in src/components/")
-        click.echo("")
+            lines.append("   • Add new pages in src/pages/")
+        lines.append("   • Add callbacks in src/callbacks/")
+        lines.append("   • Add components in src/components/")
+        lines.append("")
 
         # Step 7: Additional resources
         step_num += 1
-        click.echo(click.style(f"{step_num}. Additional resources:", fg="yellow"))
-        click.echo("   • Dash documentation: https://dash.plotly.com/")
-        if "tailwind" in config.styling:
-            click.echo("   • Tailwind CSS docs: https://tailwindcss.com/docs")
-        click.echo(
+        lines.append(click.style(f"{step_num}. Additional resources:", fg="yellow"))
+        lines.append("   • Dash documentation: https://dash.plotly.com/")
+        if has_tailwind:
+            lines.append("   • Tailwind CSS docs: https://tailwindcss.com/docs")
+        lines.append(
             "   • Dash Bootstrap Components: https://dash-bootstrap-components.opensource.faculty.ai/"
         )
-        click.echo("")
+        lines.append("")
+
+        lines.append(click.style("🎉 Happy coding!", fg="green", bold=True))
+        lines.append("")
 
-        click.echo(click.style("🎉 Happy coding!", fg="green", bold=True))
-        click.echo("")
+        click.echo("\n".join(lines))
 
     def _cleanup_on_error(self) -> None:
         """
@@ -509,20 +624,52 @@ module.exports = {
         If project generation fails mid-process, we remove the
         created project directory to prevent leaving partial/broken projects
         on the filesystem. Only cleans up if self.project_name exists.
+
+        Anything that could not be removed is reported rather than silently left behind.
         """
+        import shutil
+
         # Only cleanup if we created a new directory (not if initializing current dir)
         if (
             self.project_path
             and self.project_path != Path(".")
             and os.path.exists(self.project_path)
         ):
-            # Remove the project directory and its contents
-            shutil.rmtree(self.project_path)
             click.echo(
                 click.style(
-                    f"Removed partially created project directory: {self.project_name}", fg="blue"
+                    f"Removing partially created project directory: {self.project_name}",
+                    fg="blue",
                 )
             )
+
+            # Remove the project directory and its contents, collecting (rather than raising)
+            # failures so that as much as possible is removed
+            failures: list[tuple[str, BaseException]] = []
+
+            def on_error(_function, path: str, error: BaseException) -> None:
+                failures.append((path, error))
+
+            shutil.rmtree(self.project_path, onexc=on_error)
+
+            if not failures:
+                click.echo(
+                    click.style(
+                        f"Removed partially created project directory: {self.project_name}",
+                        fg="blue",
+                    )
+                )
+                return
+
+            # Only show the first few failures; one problem usually affects many files
+            max_shown = 5
+            lines = [
+                f"⚠️  Warning: Could not fully remove partially created project directory "
+                f"{self.project_name}. Please remove it manually.",
+                *(f"   {path}: {error}" for path, error in failures[:max_shown]),
+            ]
+            if len(failures) > max_shown:
+                lines.append(f"   ... and {len(failures) - max_shown} more")
+            click.echo(click.style("\n".join(lines), fg="yellow"), err=True)
         elif self.project_path == Path("."):
             click.echo(
                 click.style(
@@ -1,17 +1,28 @@
-from typing import Any, List
+from typing import Any, FrozenSet
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ProjectConfig(BaseModel):
     """Defines the required and optional fields for the project configuration."""
 
+    # The configuration is built once from the prompts and only read afterwards
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        str_strip_whitespace=True,
+    )
+
     project_name: str = Field(..., description="The name of the project.")
     author_name: str = Field(..., description="The name of the author.")
     author_email: str = Field(..., description="The email of the author.")
     description: str = Field(..., description="The description of the project.")
-    styling: List[str] = Field(default=[], description="The styling framework to use.")
-    animations: List[str] = Field(default=[], description="The animation library to use.")
+    styling: FrozenSet[str] = Field(
+        default=frozenset(), description="The styling framework to use."
+    )
+    animations: FrozenSet[str] = Field(
+        default=frozenset(), description="The animation library to use."
+    )
     include_pages: bool = Field(default=False, description="Whether to include pages.")
     include_tests: bool = Field(default=True, description="Whether to include pytest scaffolding.")
     include_auth: bool = Field(default=False, description="Whether to include authentication.")
@@ -26,27 +37,26 @@ class ProjectConfig(BaseModel):
             "for the generated project."
         ),
     )
-    port: int = Field(default=8000, description="The port to run the application on.")
+    port: int = Field(
+        default=8000, ge=1, le=65535, description="The port to run the application on."
+    )
 
     @field_validator("styling", "animations", mode="before")
     @classmethod
-    def validate_none(cls, value: Any) -> List[str]:
+    def validate_none(cls, value: Any) -> FrozenSet[str]:
         """Either
         - removes `none` from the list of values if there are other values in the list, or
-        - returns an empty list if `none` is the only value in the list
+        - returns an empty set if `none` is the only value in the list
+
+        A `frozenset` is used since these are only ever checked for membership
+        (e.g. `"tailwind" in config.styling`).
         """
         if not value:
-            return []
-
-        # Convert to list if it's not already (e.g., if it's a string)
-        if not isinstance(value, list):
-            value = [value]
-
-        # Remove "none" from the list
-        filtered: List[str] = [v for v in value if v != "none"]  # type: ignore
+            return frozenset()
 
-        # If "none" was the only value, return empty list
-        if "none" in value and not filtered:
-            return []
+        # Wrap a single value (e.g., a string) so it can be iterated over
+        if isinstance(value, str):
+            value = (value,)
 
-        return filtered
+        # Remove "none" in a single pass; if "none" was the only value this is already empty
+        return frozenset(v for v in value if v != "none")
@@ -3,147 +3,232 @@ This module contains the CLI prompts the user will be seeing when
 they run the `create-dash-app` CLI.
 """
 
-import getpass
 import os
-import re
+from functools import lru_cache
+from itertools import pairwise
+from typing import TYPE_CHECKING
 
-import questionary
+if TYPE_CHECKING:
+    import questionary
 
-from .models.project_config import ProjectConfig
+    from .models.project_config import ProjectConfig
 
-custom_style = questionary.Style([
-    ("qmark", "fg:#00d9ff bold"),  # Bright cyan
-    ("question", "fg:#ff1493 bold"),  # Hot pink
-    ("answer", "fg:#00ff7f bold"),  # Spring green
-    ("pointer", "fg:#ff6600 bold"),  # Vibrant orange
-    ("highlighted", "fg:#ffff00 bold"),  # Bright yellow
-    ("selected", "fg:#9d00ff bold"),  # Electric purple
-    ("separator", "fg:#00bfff bold"),  # Deep sky blue
-    ("instruction", "fg:#ff69b4 italic"),  # Light pink
-    ("text", ""),
-    ("disabled", "fg:#888888"),  # Gray
-    ("default", "fg:#00ff88 bold"),  # Mint green
-])
+# Maps hyphens and spaces to underscores in a single pass (see `normalize_name`)
+NAME_TRANSLATION = str.maketrans("- ", "__")
+
+# Maximum length of an email address (RFC 5321)
+MAX_EMAIL_LENGTH = 254
+
+# Options offered by the styling and animations prompts (besides `none`)
+STYLING_OPTIONS = ("tailwind", "bootstrap", "bulma", "daisyui", "unocss", "windi")
+ANIMATION_OPTIONS = ("animate.css", "animejs", "scrollreveal", "animatecss", "motion")
+
+
+@lru_cache(maxsize=1)
+def _custom_style() -> "questionary.Style":
+    """The `questionary` style shared by every prompt, built on first use."""
+    import questionary
+
+    return questionary.Style([
+        ("qmark", "fg:#00d9ff bold"),  # Bright cyan
+        ("question", "fg:#ff1493 bold"),  # Hot pink
+        ("answer", "fg:#00ff7f bold"),  # Spring green
+        ("pointer", "fg:#ff6600 bold"),  # Vibrant orange
+        ("highlighted", "fg:#ffff00 bold"),  # Bright yellow
+        ("selected", "fg:#9d00ff bold"),  # Electric purple
+        ("separator", "fg:#00bfff bold"),  # Deep sky blue
+        ("instruction", "fg:#ff69b4 italic"),  # Light pink
+        ("text", ""),
+        ("disabled", "fg:#888888"),  # Gray
+        ("default", "fg:#00ff88 bold"),  # Mint green
+    ])
+
+
+@lru_cache(maxsize=1)
+def _separator() -> "questionary.Separator":
+    """The `questionary` separator shared by every choice list, built on first use."""
+    import questionary
+
+    return questionary.Separator()
+
+
+@lru_cache(maxsize=None)
+def _choices(options: tuple[str, ...]) -> tuple["str | questionary.Separator", ...]:
+    """The choices of a checkbox prompt: `none`, a separator, then the given options."""
+    return ("none", _separator(), *options)
 
 
 def validate_email(email: str) -> bool:
     """Validate an email address."""
-    return re.search(r"[^@]+@[^@]+\.[^@]+", email) is not None and email != ""
+    # Same check as `re.search(r"[^@]+@[^@]+\.[^@]+", email)` but without the regex engine
+    # since this runs on every keystroke of the email prompt: some `@` must have a non-empty
+    # local part right before it and a `.` after it that is neither the first nor the last
+    # character of the domain part right after it.
+    # Cheap early exits first: most keystrokes happen while the local part is still being
+    # typed (no `@` yet), and no address may be longer than 254 characters (RFC 5321).
+    if not email or len(email) > MAX_EMAIL_LENGTH or "@" not in email:
+        return False
+
+    for local, domain in pairwise(email.split("@")):
+        if local and 0 < domain.find(".", 1) < len(domain) - 1:
+            return True
+    return False
+
+
+def validate_port(port: str) -> bool:
+    """Validate a port number, i.e. an integer between 1 and 65535."""
+    try:
+        return 1 <= int(port) <= 65535
+    except ValueError:
+        return False
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a project/directory name for comparison (handle hyphens, spaces, case)."""
+    return name.translate(NAME_TRANSLATION).lower()
 
 
 # Disable v1 flags until v0.2.0 is released.
 DISABLE_V1_FLAGS = True
 
+# Values used for the v1 flags while they are disabled
+V1_FLAG_DEFAULTS = {
+    "include_tests": True,
+    "include_auth": False,
+    "include_database": False,
+    "include_docker": True,
+}
+
+# Instructions shown on the v1 prompts (when enabled) about answers having no effect yet
+V1_NOOP_FALSE_INSTRUCTION = (
+    "\nSelecting `False` will not have any effect until `create-dash-app: v.0.2.0`."
+)
+V1_NOOP_TRUE_INSTRUCTION = (
+    "\nSelecting `True` will not have any effect until `create-dash-app: v.0.2.0`."
+)
 
-def collect_project_config() -> ProjectConfig:
+
+def collect_project_config() -> "ProjectConfig":
     """
     Collect user configuration and generate a new Dash application boilerplate.
     """
+    # Imported here since `questionary` (and `prompt_toolkit` with it) and Pydantic are
+    # only needed once the interactive prompts actually run, not for e.g. `--help`
+    import getpass
+
+    import questionary
+
+    from .models.project_config import ProjectConfig
+
+    default_author_name = getpass.getuser()
 
-    config = questionary.form(
-        project_name=questionary.text("Project Name: ", default="my-dash-app", style=custom_style),
-        author_name=questionary.text(
-            "Author Name: ", default=getpass.getuser(), style=custom_style
+    questions = {
+        "project_name": questionary.text(
+            "Project Name: ", default="my-dash-app", style=_custom_style()
         ),
-        author_email=questionary.text(
-            "Author Email: ", default="", validate=validate_email, style=custom_style
+        "author_name": questionary.text(
+            "Author Name: ", default=default_author_name, style=_custom_style()
         ),
-        description=questionary.text(
-            "Project Description: ", default="A Dash application", style=custom_style
+        "author_email": questionary.text(
+            "Author Email: ", default="", validate=validate_email, style=_custom_style()
         ),
-        styling=questionary.checkbox(
+        "description": questionary.text(
+            "Project Description: ", default="A Dash application", style=_custom_style()
+        ),
+        "styling": questionary.checkbox(
             "Which CSS framework would you like to use?",
-            choices=[
-                "none",
-                questionary.Separator(),
-                "tailwind",
-                "bootstrap",
-                "bulma",
-                "daisyui",
-                "unocss",
-                "windi",
-            ],
+            choices=_choices(STYLING_OPTIONS),
             default="tailwind",
-            style=custom_style,
+            style=_custom_style(),
         ),
-        animations=questionary.checkbox(
+        "animations": questionary.checkbox(
             "Which animation library would you like to use?",
-            choices=[
-                "none",
-                questionary.Separator(),
-                "animate.css",
-                "animejs",
-                "scrollreveal",
-                "animatecss",
-                "motion",
-            ],
+            choices=_choices(ANIMATION_OPTIONS),
             default="none",
-            style=custom_style,
+            style=_custom_style(),
         ),
-        include_pages=questionary.confirm(
+        "include_pages": questionary.confirm(
             "Would you like to include multi-page routing?",
             default=False,
-            style=custom_style,
+            style=_custom_style(),
         ),
-        include_tests=questionary.confirm(
+    }
+
+    # Only build the v1 prompts if they will actually be asked; otherwise their
+    # defaults are filled in after the form is answered
+    if not DISABLE_V1_FLAGS:
+        questions["include_tests"] = questionary.confirm(
             "Would you like to include pytest scaffolding?",
             default=True,
-            instruction=(
-                "\nSelecting `False` will not have any effect until `create-dash-app: v.0.2.0`."
-            ),
-            style=custom_style,
-        ).skip_if(DISABLE_V1_FLAGS, default=True),
-        include_auth=questionary.confirm(
+            instruction=V1_NOOP_FALSE_INSTRUCTION,
+            style=_custom_style(),
+        )
+        questions["include_auth"] = questionary.confirm(
             "Would you like to include authentication?",
             default=False,
-            instruction=(
-                "\nSelecting `True` will not have any effect until `create-dash-app: v.0.2.0`."
-            ),
-            style=custom_style,
-        ).skip_if(DISABLE_V1_FLAGS, default=False),
-        include_database=questionary.confirm(
+            instruction=V1_NOOP_TRUE_INSTRUCTION,
+            style=_custom_style(),
+        )
+        questions["include_database"] = questionary.confirm(
             "Would you like to include a database?",
             default=False,
-            instruction=(
-                "\nSelecting `True` will not have any effect until `create-dash-app: v.0.2.0`."
-            ),
-            style=custom_style,
-        ).skip_if(DISABLE_V1_FLAGS, default=False),
-        include_docker=questionary.confirm(
+            instruction=V1_NOOP_TRUE_INSTRUCTION,
+            style=_custom_style(),
+        )
+        questions["include_docker"] = questionary.confirm(
             "Would you like to include a Dockerfile and docker-compose.yml?",
             default=True,
-            instruction=(
-                "\nSelecting `False` will not have any effect until `create-dash-app: v.0.2.0`."
-            ),
-            style=custom_style,
-        ).skip_if(DISABLE_V1_FLAGS, default=True),
-        configure_pre_commit=questionary.confirm(
-            "Would you like to include baseline pre-commit hook configurations?",
-            default=True,
-            style=custom_style,
-        ),
-        port=questionary.text(
-            "What port would you like to run the application on?",
-            default="8000",
-            style=custom_style,
-        ),
-    ).ask()
+            instruction=V1_NOOP_FALSE_INSTRUCTION,
+            style=_custom_style(),
+        )
+
+    questions["configure_pre_commit"] = questionary.confirm(
+        "Would you like to include baseline pre-commit hook configurations?",
+        default=True,
+        style=_custom_style(),
+    )
+    questions["port"] = questionary.text(
+        "What port would you like to run the application on?",
+        default="8000",
+        validate=validate_port,
+        style=_custom_style(),
+    )
+
+    config = questionary.form(**questions).ask()
+    # Already validated while typing, so this conversion can't fail
+    config["port"] = int(config["port"])
+    # Strip here (as `ProjectConfig` would) so the checks below see the final project name
+    config["project_name"] = config["project_name"].strip()
+    if DISABLE_V1_FLAGS:
+        config.update(V1_FLAG_DEFAULTS)
 
     # Smart detection: If CWD name matches project name, offer to initialize current directory
-    cwd_name = os.path.basename(os.getcwd())
+    # Only the last path component is decoded rather than the whole CWD path
+    cwd_name = os.fsdecode(os.path.basename(os.getcwdb()))
     project_name = config["project_name"]
 
-    # Normalize names for comparison (handle hyphens, underscores, case)
-    def normalize_name(name: str) -> str:
-        return name.lower().replace("-", "_").replace(" ", "_")
-
-    if normalize_name(cwd_name) == normalize_name(project_name):
-        # Check if directory is empty or only has .venv
-        dir_contents = set(os.listdir("."))
-        dir_contents.discard(".venv")  # Ignore .venv if present
-        dir_contents.discard(".git")  # Ignore .git if present
+    # Nothing to offer if the user already asked to initialize the current directory.
+    # Normalizing keeps the length of (practically) any name, so names of different lengths
+    # can be told apart without normalizing them.
+    if (
+        project_name != "."
+        and len(cwd_name) == len(project_name)
+        and normalize_name(cwd_name) == normalize_name(project_name)
+    ):
+        # Check if directory is empty or only has .venv (and .git), stopping the scan as
+        # soon as there are too many other entries for it to count as empty
+        has_git = False
+        other_entries = 0
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    has_git = True
+                elif entry.name != ".venv":
+                    other_entries += 1
+                    if other_entries > 1:
+                        break
 
-        if not dir_contents or (len(dir_contents) == 1 and ".git" in os.listdir(".")):
+        if other_entries == 0 or (other_entries == 1 and has_git):
             # Directory is essentially empty
             if questionary.confirm(
                 f"📁 You're in a directory named '{cwd_name}' "
@@ -151,15 +236,15 @@ def collect_project_config() -> ProjectConfig:
                 "Would you like to initialize the current directory "
                 "instead of creating a nested one?",
                 default=True,
-                style=custom_style,
+                style=_custom_style(),
             ).ask():
                 # Use "." as sentinel to indicate "initialize current directory"
                 config["project_name"] = "."
                 # Instantiate the Pydantic model to trigger validation and field validators
-                return ProjectConfig(**config)
+                return ProjectConfig.model_validate(config)
 
-    # Validate uniqueness of `project_name`
-    if os.path.exists(config["project_name"]) and config["project_name"] != ".":
+    # Validate uniqueness of `project_name` (a broken symlink still takes up the name)
+    if config["project_name"] != "." and os.path.lexists(config["project_name"]):
         raise FileExistsError(
             f"Project `{config['project_name']}` already exists! "
             "Please choose a different project name. "
@@ -168,4 +253,4 @@ def collect_project_config() -> ProjectConfig:
         )
 
     # Instantiate the Pydantic model to trigger validation and field validators
-    return ProjectConfig(**config)
+    return ProjectConfig.model_validate(config)
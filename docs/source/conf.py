@@ -5,10 +5,19 @@
 
 # If extensions or modules to document with `autodoc` are in another directory,
 # we need to add these directories to sys.path here.
+import os
 import sys
-from pathlib import Path
+from types import MappingProxyType
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# The resolved repository root is shared with Sphinx's (parallel) worker processes through an
+# environment variable so that only the first process pays for `Path.resolve()`.
+_root = os.environ.get("CDA_DOCS_ROOT")
+if not _root:
+    from pathlib import Path
+
+    _root = str(Path(__file__).resolve().parents[2])
+    os.environ["CDA_DOCS_ROOT"] = _root
+sys.path.insert(0, _root)
 
 # The above is important since we use `autodoc` to generate documentation from the code itself,
 # and it needs to know where the code is located.
@@ -24,14 +33,16 @@ release = "v0.1.dev20251106"
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
-extensions = [
+# NOTE: Values Sphinx only reads are tuples rather than lists, except for `templates_path` and
+# `exclude_patterns` which Sphinx concatenates with lists internally.
+extensions = (
     "sphinx.ext.doctest",  # Includes code snippets in the documentation
     "sphinx.ext.autodoc",  # Automatically generate documentation from docstrings in the code itself
     "sphinx.ext.autosummary",  # Automatically generate summary pages for each module and class
     "sphinx.ext.napoleon",  # Support for Google style docstrings which we use in this project
     "sphinxcontrib.video",  # Support for embedding videos in the documentation
     "sphinx_new_tab_link",  # Open external links in a NEW tab
-]
+)
 
 templates_path = ["_templates"]
 exclude_patterns = []
@@ -52,7 +63,7 @@ autosummary_generate = True  # Automatically generate summary pages for each mod
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
 html_theme = "furo"
-html_static_path = ["_static"]
+html_static_path = ("_static",)
 
 # -- Other Configurations ----------------------------------------------------
 primary_domain = "py"
@@ -63,6 +74,34 @@ new_tab_link_show_external_link_icon = True
 # These functions run at specific points during the documentation build process.
 # See https://www.sphinx-doc.org/en/master/extdev/appapi.html#sphinx-core-events
 # for a complete list of available events.
+#
+# Handlers are registered inside `setup()` below, e.g.:
+#
+#   # Example: Run code before the build starts
+#   def on_builder_inited(app):
+#       print("Builder initialized!")
+#   app.connect('builder-inited', on_builder_inited)
+#
+#   # Example: Modify docstrings during autodoc processing
+#   def modify_docstring(app, what, name, obj, options, lines):
+#       # Modify lines list in-place to change the docstring
+#       if 'DEPRECATED' in ''.join(lines):
+#           lines.insert(0, '.. warning:: This is deprecated')
+#   app.connect('autodoc-process-docstring', modify_docstring)
+#
+#   # Example: Run code after the build completes
+#   def on_build_finished(app, exception):
+#       if exception is None:
+#           print("Build completed successfully!")
+#   app.connect('build-finished', on_build_finished)
+
+# Extension metadata returned by `setup()`. It never changes, so a single read-only mapping
+# is shared instead of building a new dict on every call.
+_SETUP_METADATA = MappingProxyType({
+    "version": "1.0",  # Extension version (for debugging/logging)
+    "parallel_read_safe": True,  # Safe for parallel reading (enables parallel builds)
+    "parallel_write_safe": True,  # Safe for parallel writing (enables parallel builds)
+})
 
 
 def setup(app):
@@ -86,28 +125,7 @@ def setup(app):
     - 'env-purge-doc': Fired when a document is removed from the environment
 
     Returns:
-        dict: Extension metadata including version and parallel build safety flags
+        MappingProxyType: Read-only extension metadata including version and parallel build
+        safety flags
     """
-    # Example: Run code before the build starts
-    # def on_builder_inited(app):
-    #     print("Builder initialized!")
-    # app.connect('builder-inited', on_builder_inited)
-
-    # Example: Modify docstrings during autodoc processing
-    # def modify_docstring(app, what, name, obj, options, lines):
-    #     # Modify lines list in-place to change the docstring
-    #     if 'DEPRECATED' in ''.join(lines):
-    #         lines.insert(0, '.. warning:: This is deprecated')
-    # app.connect('autodoc-process-docstring', modify_docstring)
-
-    # Example: Run code after the build completes
-    # def on_build_finished(app, exception):
-    #     if exception is None:
-    #         print("Build completed successfully!")
-    # app.connect('build-finished', on_build_finished)
-
-    return {
-        "version": "1.0",  # Extension version (for debugging/logging)
-        "parallel_read_safe": True,  # Safe for parallel reading (enables parallel builds)
-        "parallel_write_safe": True,  # Safe for parallel writing (enables parallel builds)
-    }
+    return _SETUP_METADATA